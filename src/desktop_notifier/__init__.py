@@ -2,6 +2,8 @@
 """
 Desktop notifications for Windows, Linux, macOS, iOS and iPadOS.
 """
+from typing import Any
+
 from .main import (
     DesktopNotifier,
     Button,
@@ -13,8 +15,8 @@ from .main import (
     Sound,
     Attachment,
     DEFAULT_SOUND,
-    DEFAULT_ICON,
 )
+from . import base
 from .sync import DesktopNotifierSync
 
 __version__ = "5.0.1"
@@ -38,3 +40,9 @@ __all__ = [
     "DEFAULT_SOUND",
     "DEFAULT_ICON",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_ICON":
+        return base.DEFAULT_ICON
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
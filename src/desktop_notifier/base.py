@@ -5,6 +5,7 @@ must inherit from :class:`DesktopNotifierBase`.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 from urllib.parse import urlparse, unquote
 import urllib.parse
@@ -12,15 +13,13 @@ import warnings
 import dataclasses
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from enum import Enum, auto
-from collections import deque
+from enum import Enum, IntFlag, auto
+from collections import OrderedDict
 from pathlib import Path
 from typing import (
-    Dict,
     Callable,
     Any,
-    Deque,
-    List,
+    Tuple,
     Sequence,
     ContextManager,
 )
@@ -54,9 +53,30 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-python_icon_path = resource_path(
-    package="desktop_notifier.resources", resource="python.png"
-).__enter__()
+_python_icon_path: Path | None = None
+
+
+def _get_python_icon_path() -> Path:
+    # Resolve the bundled icon on first use only. For zipped packages, this may
+    # extract the file to disk, which we don't want to do at import time.
+    global _python_icon_path
+
+    if _python_icon_path is None:
+        cm = resource_path(package="desktop_notifier.resources", resource="python.png")
+        _python_icon_path = cm.__enter__()
+        atexit.register(cm.__exit__, None, None, None)
+
+    return _python_icon_path
+
+
+def __getattr__(name: str) -> Any:
+    if name == "python_icon_path":
+        return _get_python_icon_path()
+    if name == "DEFAULT_ICON":
+        icon = Icon(path=_get_python_icon_path())
+        globals()["DEFAULT_ICON"] = icon
+        return icon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(frozen=True)
@@ -148,8 +168,18 @@ class Sound(Resource):
     pass
 
 
-DEFAULT_ICON: Icon = Icon(path=python_icon_path)
-"""Python icon"""
+DEFAULT_ICON: Icon
+"""Python icon, resolved on first access"""
+
+
+class _DefaultIcon:
+    """Marker for default arguments which resolve to :data:`DEFAULT_ICON` when used"""
+
+    def __repr__(self) -> str:
+        return "DEFAULT_ICON"
+
+
+_DEFAULT_ICON_SENTINEL = _DefaultIcon()
 
 DEFAULT_SOUND: Sound = Sound(name="default")
 """Default system notification sound"""
@@ -159,7 +189,7 @@ class AuthorisationError(Exception):
     """Raised when we are not authorised to send notifications"""
 
 
-class Urgency(Enum):
+class Urgency(str, Enum):
     """Enumeration of notification levels
 
     The interpretation and visuals depend on the platform.
@@ -208,6 +238,26 @@ class Notification:
     depending on the platform.
     """
 
+    __slots__ = (
+        "_identifier",
+        "_winrt_identifier",
+        "_macos_identifier",
+        "_dbus_identifier",
+        "title",
+        "message",
+        "urgency",
+        "icon",
+        "buttons",
+        "reply_field",
+        "on_clicked",
+        "on_dismissed",
+        "attachment",
+        "sound",
+        "thread",
+        "timeout",
+        "__weakref__",
+    )
+
     title: str
     """Notification title"""
 
@@ -240,10 +290,10 @@ class Notification:
     sound: Sound | None
     """A sound to play on notification"""
 
-    thread: str | None = None
+    thread: str | None
     """An identifier to group related notifications together, e.g., from a chat space"""
 
-    timeout: int = -1
+    timeout: int
     """Duration in seconds for which the notification is shown"""
 
     def __init__(
@@ -257,7 +307,7 @@ class Notification:
         on_clicked: Callable[[], Any] | None = None,
         on_dismissed: Callable[[], Any] | None = None,
         attachment: str | Attachment | None = None,
-        sound: bool | Sound | None = False,
+        sound: bool | Sound | None = None,
         thread: str | None = None,
         timeout: int = -1,
     ) -> None:
@@ -330,8 +380,12 @@ class Notification:
         )
 
 
-class Capability(Enum):
-    """Notification capabilities that can be supported by a platform"""
+class Capability(IntFlag):
+    """Notification capabilities that can be supported by a platform
+
+    Capabilities are flags and can be combined with bitwise operators. Check for a
+    capability with ``Capability.SOUND in capabilities``.
+    """
 
     APP_NAME = auto()
     """Supports setting a custom app name"""
@@ -400,8 +454,9 @@ class DesktopNotifierBase(ABC):
     ) -> None:
         self.app_name = app_name
         self.notification_limit = notification_limit
-        self._current_notifications: Deque[Notification] = deque([], notification_limit)
-        self._notification_for_nid: Dict[str, Notification] = {}
+        self._current_notifications: OrderedDict[str, Notification] = OrderedDict()
+        self._current_notifications_snapshot: Tuple[Notification, ...] = ()
+        self._current_notifications_dirty = False
 
     @abstractmethod
     async def request_authorisation(self) -> bool:
@@ -428,12 +483,15 @@ class DesktopNotifierBase(ABC):
 
         :param notification: Notification to send.
         """
-        notification_to_replace: Notification | None
+        notification_to_replace: Notification | None = None
 
-        if len(self._current_notifications) == self.notification_limit:
-            notification_to_replace = self._current_notifications.popleft()
-        else:
-            notification_to_replace = None
+        # Evict the oldest notifications until there is room for the new one.
+        while (
+            self.notification_limit
+            and len(self._current_notifications) >= self.notification_limit
+        ):
+            _, notification_to_replace = self._current_notifications.popitem(last=False)
+            self._current_notifications_dirty = True
 
         try:
             await self._send(notification, notification_to_replace)
@@ -442,28 +500,42 @@ class DesktopNotifierBase(ABC):
             # The dbus service may not be available, we might be in a headless session,
             # etc. Since notifications are not critical to an application, we only emit
             # a warning.
-            if notification_to_replace:
-                self._current_notifications.appendleft(notification_to_replace)
+            # Only restore the evicted notification if no concurrent send has taken its
+            # place in the meantime.
+            if notification_to_replace and (
+                not self.notification_limit
+                or len(self._current_notifications) < self.notification_limit
+            ):
+                nid = notification_to_replace.identifier
+                self._current_notifications[nid] = notification_to_replace
+                self._current_notifications.move_to_end(nid, last=False)
+                self._current_notifications_dirty = True
             logger.warning("Notification failed", exc_info=True)
         else:
             logger.debug("Notification sent: %s", notification)
-            self._current_notifications.append(notification)
-            self._notification_for_nid[notification.identifier] = notification
+            self._current_notifications[notification.identifier] = notification
+            # Concurrent sends may have filled the cache while we were awaiting _send.
+            while (
+                self.notification_limit
+                and len(self._current_notifications) > self.notification_limit
+            ):
+                self._current_notifications.popitem(last=False)
+            self._current_notifications_dirty = True
 
     def _clear_notification_from_cache(self, notification: Notification) -> None:
         """
         Removes the notification from our cache. Should be called by backends when the
         notification is closed.
         """
-        try:
-            self._current_notifications.remove(notification)
-        except ValueError:
-            pass
+        if self._current_notifications.pop(notification.identifier, None) is not None:
+            self._current_notifications_dirty = True
 
-        try:
-            self._notification_for_nid.pop(notification.identifier)
-        except KeyError:
-            pass
+    def _get_notification_from_cache(self, nid: str) -> Notification | None:
+        """
+        Returns the cached notification for the given platform identifier, if any.
+        Should be used by backends to look up the notification for a callback.
+        """
+        return self._current_notifications.get(nid)
 
     @abstractmethod
     async def _send(
@@ -487,11 +559,17 @@ class DesktopNotifierBase(ABC):
         ...
 
     @property
-    def current_notifications(self) -> List[Notification]:
+    def current_notifications(self) -> Tuple[Notification, ...]:
         """
-        A list of all notifications which currently displayed in the notification center
+        A read-only snapshot of all notifications which are currently displayed in the
+        notification center
         """
-        return list(self._current_notifications)
+        if self._current_notifications_dirty:
+            self._current_notifications_snapshot = tuple(
+                self._current_notifications.values()
+            )
+            self._current_notifications_dirty = False
+        return self._current_notifications_snapshot
 
     async def clear(self, notification: Notification) -> None:
         """
@@ -527,7 +605,7 @@ class DesktopNotifierBase(ABC):
 
         await self._clear_all()
         self._current_notifications.clear()
-        self._notification_for_nid.clear()
+        self._current_notifications_dirty = True
 
     @abstractmethod
     async def _clear_all(self) -> None:
@@ -538,9 +616,9 @@ class DesktopNotifierBase(ABC):
         ...
 
     @abstractmethod
-    async def get_capabilities(self) -> frozenset[Capability]:
+    async def get_capabilities(self) -> Capability:
         """
         Returns the functionality supported by the implementation and, for Linux / dbus,
-        the notification server.
+        the notification server, as combined :class:`Capability` flags.
         """
         ...
@@ -239,7 +239,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         :param action_key: A string identifying the action to take. We choose those keys
             ourselves when scheduling the notification.
         """
-        notification = self._notification_for_nid.get(identifier_from_dbus(nid))
+        notification = self._get_notification_from_cache(identifier_from_dbus(nid))
 
         if notification:
             self._clear_notification_from_cache(notification)
@@ -268,7 +268,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         :param nid: The platform's notification ID as an integer.
         :param reason: An integer describing the reason why the notification was closed.
         """
-        notification = self._notification_for_nid.get(identifier_from_dbus(nid))
+        notification = self._get_notification_from_cache(identifier_from_dbus(nid))
 
         if notification:
             self._clear_notification_from_cache(notification)
@@ -276,42 +276,40 @@ class DBusDesktopNotifier(DesktopNotifierBase):
             if reason == NOTIFICATION_CLOSED_DISMISSED and notification.on_dismissed:
                 notification.on_dismissed()
 
-    async def get_capabilities(self) -> frozenset[Capability]:
+    async def get_capabilities(self) -> Capability:
         if not self.interface:
             self.interface = await self._init_dbus()
 
-        capabilities = {
-            Capability.APP_NAME,
-            Capability.ICON,
-            Capability.TITLE,
-            Capability.TIMEOUT,
-            Capability.URGENCY,
-        }
+        capabilities = (
+            Capability.APP_NAME
+            | Capability.ICON
+            | Capability.TITLE
+            | Capability.TIMEOUT
+            | Capability.URGENCY
+        )
 
         # Capabilities supported by some notification servers.
         # See https://specifications.freedesktop.org/notification-spec/notification-spec-latest.html#protocol.
         if hasattr(self.interface, "on_notification_closed"):
-            capabilities.add(Capability.ON_CLICKED)
-            capabilities.add(Capability.ON_DISMISSED)
+            capabilities |= Capability.ON_CLICKED | Capability.ON_DISMISSED
 
         cps = await self.interface.call_get_capabilities()  # type:ignore[attr-defined]
         if "actions" in cps:
-            capabilities.add(Capability.BUTTONS)
+            capabilities |= Capability.BUTTONS
         if "body" in cps:
-            capabilities.add(Capability.MESSAGE)
+            capabilities |= Capability.MESSAGE
         if "sound" in cps:
-            capabilities.add(Capability.SOUND)
-            capabilities.add(Capability.SOUND_NAME)
+            capabilities |= Capability.SOUND | Capability.SOUND_NAME
 
         hints_signature = get_hints_signature(self.interface)
         if hints_signature not in self.supported_hint_signatures:
             # Any hint-based capabilities are not supported because we got an unexpected
             # DBus interface.
-            capabilities.discard(Capability.SOUND)
-            capabilities.discard(Capability.SOUND_NAME)
-            capabilities.discard(Capability.URGENCY)
+            capabilities &= ~(
+                Capability.SOUND | Capability.SOUND_NAME | Capability.URGENCY
+            )
 
-        return frozenset(capabilities)
+        return capabilities
 
 
 def get_hints_signature(interface: ProxyInterface) -> str:
@@ -47,5 +47,5 @@ class DummyNotificationCenter(DesktopNotifierBase):
     async def _clear_all(self) -> None:
         pass
 
-    async def get_capabilities(self) -> frozenset[Capability]:
-        return frozenset()
+    async def get_capabilities(self) -> Capability:
+        return Capability(0)
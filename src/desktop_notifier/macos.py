@@ -19,7 +19,7 @@ import enum
 import asyncio
 from pathlib import Path
 from concurrent.futures import Future
-from typing import cast, Optional
+from typing import Optional
 
 # external imports
 from packaging.version import Version
@@ -102,8 +102,11 @@ class NotificationCenterDelegate(NSObject):  # type:ignore
     ) -> None:
         # Get the notification which was clicked from the platform ID.
         platform_nid = py_from_ns(response.notification.request.identifier)
-        py_notification = self.interface._notification_for_nid[platform_nid]
-        py_notification = cast(Notification, py_notification)
+        py_notification = self.interface._get_notification_from_cache(platform_nid)
+
+        if not py_notification:
+            completion_handler()
+            return
 
         self.interface._clear_notification_from_cache(py_notification)
 
@@ -410,23 +413,23 @@ class CocoaNotificationCenter(DesktopNotifierBase):
         """
         self.nc.removeAllDeliveredNotifications()
 
-    async def get_capabilities(self) -> frozenset[Capability]:
-        capabilities = {
-            Capability.TITLE,
-            Capability.MESSAGE,
-            Capability.BUTTONS,
-            Capability.REPLY_FIELD,
-            Capability.ON_CLICKED,
-            Capability.ON_DISMISSED,
-            Capability.SOUND,
-            Capability.SOUND_NAME,
-            Capability.THREAD,
-            Capability.ATTACHMENT,
-        }
+    async def get_capabilities(self) -> Capability:
+        capabilities = (
+            Capability.TITLE
+            | Capability.MESSAGE
+            | Capability.BUTTONS
+            | Capability.REPLY_FIELD
+            | Capability.ON_CLICKED
+            | Capability.ON_DISMISSED
+            | Capability.SOUND
+            | Capability.SOUND_NAME
+            | Capability.THREAD
+            | Capability.ATTACHMENT
+        )
         if macos_version >= Version("12.0"):
-            capabilities.add(Capability.URGENCY)
+            capabilities |= Capability.URGENCY
 
-        return frozenset(capabilities)
+        return capabilities
 
 
 def log_nserror(error: NSError, prefix: str) -> None:  # type:ignore[valid-type]
@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import (
     Type,
     Callable,
-    List,
+    Tuple,
     Any,
     TypeVar,
     Sequence,
@@ -24,6 +24,7 @@ from typing import (
 from packaging.version import Version
 
 # local imports
+from . import base
 from .base import (
     Capability,
     Urgency,
@@ -35,7 +36,8 @@ from .base import (
     Notification,
     DesktopNotifierBase,
     DEFAULT_SOUND,
-    DEFAULT_ICON,
+    _DefaultIcon,
+    _DEFAULT_ICON_SENTINEL,
 )
 
 __all__ = [
@@ -59,6 +61,15 @@ T = TypeVar("T")
 
 default_event_loop_policy = asyncio.DefaultEventLoopPolicy()
 
+DEFAULT_ICON: Icon
+"""See :data:`desktop_notifier.base.DEFAULT_ICON`"""
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_ICON":
+        return base.DEFAULT_ICON
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_implementation_class() -> Type[DesktopNotifierBase]:
     """
@@ -127,7 +138,7 @@ class DesktopNotifier:
     :param app_icon: Default icon to use for notifications. This should be a
         :class:`desktop_notifier.base.Icon` instance referencing either a file or a
         named system icon. :class:`str` or :class:`pathlib.Path` are also accepted but
-        deprecated.
+        deprecated. Defaults to :data:`desktop_notifier.base.DEFAULT_ICON`.
     :param notification_limit: Maximum number of notifications to keep in the system's
         notification center. This may be ignored by some implementations.
     """
@@ -137,9 +148,12 @@ class DesktopNotifier:
     def __init__(
         self,
         app_name: str = "Python",
-        app_icon: Icon | Path | str | None = DEFAULT_ICON,
+        app_icon: Icon | Path | str | _DefaultIcon | None = _DEFAULT_ICON_SENTINEL,
         notification_limit: int | None = None,
     ) -> None:
+        if isinstance(app_icon, _DefaultIcon):
+            app_icon = base.DEFAULT_ICON
+
         if isinstance(app_icon, str):
             warnings.warn(
                 message="Pass an Icon instance instead of a string. "
@@ -165,7 +179,7 @@ class DesktopNotifier:
         self._impl = impl_cls(app_name, notification_limit)
         self._did_request_authorisation = False
 
-        self._capabilities: frozenset[Capability] | None = None
+        self._capabilities: Capability | None = None
 
     @property
     def app_name(self) -> str:
@@ -269,8 +283,8 @@ class DesktopNotifier:
         return await self.send_notification(notification)
 
     @property
-    def current_notifications(self) -> List[Notification]:
-        """A list of all currently displayed notifications for this app"""
+    def current_notifications(self) -> Tuple[Notification, ...]:
+        """A read-only snapshot of all currently displayed notifications for this app"""
         return self._impl.current_notifications
 
     async def clear(self, notification: Notification) -> None:
@@ -288,10 +302,10 @@ class DesktopNotifier:
         """
         await self._impl.clear_all()
 
-    async def get_capabilities(self) -> frozenset[Capability]:
+    async def get_capabilities(self) -> Capability:
         """
         Returns which functionality is supported by the implementation.
         """
-        if not self._capabilities:
+        if self._capabilities is None:
             self._capabilities = await self._impl.get_capabilities()
         return self._capabilities
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 # system imports
 import asyncio
-from typing import Callable, Coroutine, Any, Sequence, TypeVar, List
+from typing import Callable, Coroutine, Any, Sequence, TypeVar, Tuple
 
 # local imports
 from .main import DesktopNotifier
@@ -19,7 +19,8 @@ from .base import (
     Sound,
     Attachment,
     Notification,
-    DEFAULT_ICON,
+    _DefaultIcon,
+    _DEFAULT_ICON_SENTINEL,
 )
 
 __all__ = ["DesktopNotifierSync"]
@@ -40,7 +41,7 @@ class DesktopNotifierSync:
     def __init__(
         self,
         app_name: str = "Python",
-        app_icon: Icon | None = DEFAULT_ICON,
+        app_icon: Icon | _DefaultIcon | None = _DEFAULT_ICON_SENTINEL,
         notification_limit: int | None = None,
     ) -> None:
         self._async_api = DesktopNotifier(app_name, app_icon, notification_limit)
@@ -116,8 +117,8 @@ class DesktopNotifierSync:
         return self._run_coro_sync(coro)
 
     @property
-    def current_notifications(self) -> List[Notification]:
-        """A list of all currently displayed notifications for this app"""
+    def current_notifications(self) -> Tuple[Notification, ...]:
+        """A read-only snapshot of all currently displayed notifications for this app"""
         return self._async_api.current_notifications
 
     def clear(self, notification: Notification) -> None:
@@ -130,7 +131,7 @@ class DesktopNotifierSync:
         coro = self._async_api.clear_all()
         return self._run_coro_sync(coro)
 
-    def get_capabilities(self) -> frozenset[Capability]:
+    def get_capabilities(self) -> Capability:
         """See :meth:`desktop_notifier.main.DesktopNotifier.get_capabilities`"""
         coro = self._async_api.get_capabilities()
         return self._run_coro_sync(coro)
@@ -314,23 +314,23 @@ class WinRTDesktopNotifier(DesktopNotifierBase):
         if self.manager.history:
             self.manager.history.clear(self.app_id)
 
-    async def get_capabilities(self) -> frozenset[Capability]:
-        capabilities = {
-            Capability.TITLE,
-            Capability.MESSAGE,
-            Capability.ICON,
-            Capability.BUTTONS,
-            Capability.REPLY_FIELD,
-            Capability.ON_CLICKED,
-            Capability.ON_DISMISSED,
-            Capability.THREAD,
-            Capability.ATTACHMENT,
-            Capability.SOUND,
-            Capability.SOUND_NAME,
-        }
+    async def get_capabilities(self) -> Capability:
+        capabilities = (
+            Capability.TITLE
+            | Capability.MESSAGE
+            | Capability.ICON
+            | Capability.BUTTONS
+            | Capability.REPLY_FIELD
+            | Capability.ON_CLICKED
+            | Capability.ON_DISMISSED
+            | Capability.THREAD
+            | Capability.ATTACHMENT
+            | Capability.SOUND
+            | Capability.SOUND_NAME
+        )
         # Custom audio is support only starting with the Windows 10 Anniversary update.
         # See https://learn.microsoft.com/en-us/windows/apps/design/shell/tiles-and-notifications/custom-audio-on-toasts#add-the-custom-audio.
         if sys.getwindowsversion().build >= 1607:  # type:ignore[attr-defined]
-            capabilities.add(Capability.SOUND_FILE)
+            capabilities |= Capability.SOUND_FILE
 
-        return frozenset(capabilities)
+        return capabilities
@@ -1,4 +1,7 @@
 import sys
+import asyncio
+import warnings
+import weakref
 import pytest
 
 from pathlib import Path
@@ -9,9 +12,24 @@ from desktop_notifier import (
     Sound,
     Attachment,
     ReplyField,
+    Notification,
+    Capability,
     DEFAULT_SOUND,
     DEFAULT_ICON,
 )
+from desktop_notifier.dummy import DummyNotificationCenter
+
+
+class FailingNotificationCenter(DummyNotificationCenter):
+    """A dummy backend which can fail to send notifications after yielding"""
+
+    fail = False
+
+    async def _send(self, notification, notification_to_replace):
+        if self.fail:
+            await asyncio.sleep(0)
+            raise RuntimeError("Failed to send notification")
+        await super()._send(notification, notification_to_replace)
 
 
 @pytest.mark.asyncio
@@ -41,6 +59,29 @@ async def test_send(notifier):
     assert notification.identifier != ""
 
 
+def test_default_arguments_no_warning():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        notification = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    assert notification.sound is None
+
+
+def test_notification_slots():
+    notification = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    assert not hasattr(notification, "__dict__")
+    with pytest.raises(AttributeError):
+        notification.unknown = True
+    assert weakref.ref(notification)() is notification
+
+
+def test_sound_bool_deprecated():
+    with pytest.warns(DeprecationWarning):
+        notification = Notification(
+            title="Julius Caesar", message="Et tu, Brute?", sound=True
+        )
+    assert notification.sound == DEFAULT_SOUND
+
+
 @pytest.mark.asyncio
 async def test_default_icon(notifier):
     notification = await notifier.send(
@@ -146,3 +187,96 @@ async def test_clear_all(notifier):
 
     await notifier.clear_all()
     assert len(notifier.current_notifications) == 0
+
+
+@pytest.mark.asyncio
+async def test_current_notifications_snapshot():
+    center = DummyNotificationCenter()
+    assert center.current_notifications == ()
+
+    n0 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    n1 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    await center.send(n0)
+    await center.send(n1)
+    assert center.current_notifications == (n0, n1)
+
+    await center.clear(n0)
+    assert center.current_notifications == (n1,)
+
+    await center.clear_all()
+    assert center.current_notifications == ()
+
+
+@pytest.mark.asyncio
+async def test_notification_limit():
+    center = DummyNotificationCenter(notification_limit=2)
+    notifications = [
+        Notification(title="Julius Caesar", message=str(i)) for i in range(3)
+    ]
+    for notification in notifications:
+        await center.send(notification)
+
+    assert center.current_notifications == tuple(notifications[1:])
+
+
+@pytest.mark.asyncio
+async def test_notification_limit_send_failure():
+    center = FailingNotificationCenter(notification_limit=2)
+    n0 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    n1 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    await center.send(n0)
+    await center.send(n1)
+    center.fail = True
+
+    # Read the snapshot while the oldest notification is evicted during sending.
+    task = asyncio.ensure_future(
+        center.send(Notification(title="Julius Caesar", message="Et tu, Brute?"))
+    )
+    await asyncio.sleep(0)
+    assert center.current_notifications == (n1,)
+    await task
+
+    assert center.current_notifications == (n0, n1)
+
+
+@pytest.mark.asyncio
+async def test_notification_limit_concurrent_send_failure():
+    center = FailingNotificationCenter(notification_limit=2)
+    n0 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    n1 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    await center.send(n0)
+    await center.send(n1)
+
+    # Let a send succeed while a failing send has evicted the oldest notification.
+    center.fail = True
+    task = asyncio.ensure_future(
+        center.send(Notification(title="Julius Caesar", message="Et tu, Brute?"))
+    )
+    await asyncio.sleep(0)
+    center.fail = False
+    n2 = Notification(title="Julius Caesar", message="Et tu, Brute?")
+    await center.send(n2)
+    await task
+
+    assert center.current_notifications == (n1, n2)
+
+    notifications = [
+        Notification(title="Julius Caesar", message=str(i)) for i in range(5)
+    ]
+    for notification in notifications:
+        await center.send(notification)
+
+    assert center.current_notifications == tuple(notifications[-2:])
+
+
+@pytest.mark.asyncio
+async def test_capabilities():
+    center = DummyNotificationCenter()
+    capabilities = await center.get_capabilities()
+    assert capabilities == Capability(0)
+    assert Capability.SOUND not in capabilities
+
+    capabilities = Capability.TITLE | Capability.SOUND
+    assert Capability.SOUND in capabilities
+    assert Capability.TITLE | Capability.SOUND in capabilities
+    assert Capability.MESSAGE not in capabilities